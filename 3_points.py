@@ -1,9 +1,100 @@
+import functools
+import importlib.machinery
+import importlib.util
+import math
+import os
+import sys
+
+try:
+    import numpy as np
+except ImportError:  # numpy is only needed for check_on_line_batch
+    np = None
+
+
+def _load_sibling(name):
+    """
+    imports a module lying next to this file, even when its folder
+    is not on sys.path (3_points.py itself can only be loaded by path)
+
+    :param name: module name
+    :return: module
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+
+    spec = importlib.machinery.PathFinder.find_spec(name, [os.path.dirname(os.path.abspath(__file__))])
+    if spec is None:
+        raise ImportError(f"No module named {name!r}", name=name)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    return module
+
+
+_kernel = _load_sibling("_check_on_line_kernel")
+
+
+def _jit_kernel():
+    """
+    compiles the kernel with numba. with an explicit signature njit compiles
+    right away, not on the first call. without numba the kernel runs as plain python
+
+    :return: function with the arguments of check_on_line_kernel
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return _kernel.check_on_line_kernel
+
+    # no fastmath: numba.pycc cannot enable it, and the jit and aot builds must agree
+    return njit(_kernel.SIGNATURE, cache=True)(_kernel.check_on_line_kernel)
+
+
+try:
+    # built by _check_on_line_aot.py. with it numba is not imported at all
+    _check_on_line_aot = _load_sibling("check_on_line_aot").check_on_line
+except ImportError:
+    _check_on_line_aot = None
+
+_check_on_line_kernel = _check_on_line_aot if _check_on_line_aot is not None else _jit_kernel()
+
+
+# callers may pass any float, so the cache must stay bounded
+@functools.lru_cache(maxsize=128)
+def _sin2_threshold(accuracy):
+    """
+    alfa = angle p1p2p3 lies on the line when 180-accuracy <= alfa.
+    for accuracy <= 90 that means alfa is obtuse and sin(alfa)^2 <= sin(accuracy)^2,
+    for a wider accuracy every obtuse alfa fits, and an acute one
+    only if sin(alfa)^2 >= sin(accuracy)^2
+
+    :param accuracy: calculation error in degrees, not negative
+    :return: tuple (sin(accuracy)^2, bool obtuse_only) for _check_on_line_kernel
+    """
+    eps = 0.00001 # the error of trigonometric functions, in degrees
+    accuracy += eps
+    if accuracy >= 180.0:
+        # every alfa fits. sin(180)^2 is about 1e-32, not 0, and would reject alfa = 0
+        return 0.0, False
+
+    return math.sin(math.radians(accuracy)) ** 2, accuracy <= 90.0
+
+
 def check_on_line(point1, point2, point3, accuracy= 90.0):
     """
     checks whether point 2 lies on the line drawn through points 1 and 3
     two vectors are constructed from the central point. The angle alpha
-    is found from the scalar product formulas x1*x2+y1*y2 = |a|*|b|*cos(alfa). 
-    alpha should be equal to 180, taking into account the error
+    is checked through the scalar product a*b = |a|*|b|*cos(alfa) and the
+    vector product |a x b| = |a|*|b|*sin(alfa), without computing alfa itself.
+    alpha should be equal to 180, taking into account the error.
+    if point 2 coincides with point 1 or 3, it is considered to lie on the line.
+    with accuracy=0 exactly collinear points pass (up to 0.00001 degrees),
+    a negative or nan accuracy never does
 
     :param point1: tuple of three variables (X coordinate, Y coordinate, Z coordinate)
     :param point2: central point. tuple of three variables (X coordinate, Y coordinate, Z coordinate)
@@ -12,13 +103,45 @@ def check_on_line(point1, point2, point3, accuracy= 90.0):
     :return: bool on_lint - does point 2 lie on the line drawn through points 1 and 3
     """
 
-    vector21 = (point1[0]-point2[0], point1[1]-point2[1], point1[2]-point2[2])
-    len_vector21 = (vector21[0]**2 + vector21[1]**2 + vector21[2]**2) ** 0.5
+    if not accuracy >= 0:  # also catches nan
+        return False
+
+    x1, y1, z1 = point1
+    x2, y2, z2 = point2
+    x3, y3, z3 = point3
+    sin2_accuracy, obtuse_only = _sin2_threshold(accuracy)
+
+    return _check_on_line_kernel(x1, y1, z1, x2, y2, z2, x3, y3, z3, sin2_accuracy, obtuse_only)
+
+
+def check_on_line_batch(points1, points2, points3, accuracy= 90.0):
+    """
+    vectorized version of check_on_line for N triples of points at once.
+    the same cross and dot product test is computed by numpy in one pass
+    instead of one python call per triple
+
+    :param points1: array of shape (N, 3) with the first points
+    :param points2: array of shape (N, 3) with the central points
+    :param points3: array of shape (N, 3) with the third points
+    :param accuracy: calculation error in degrees (angle p1p2p3+-accuracy=180)
+    :return: bool array of shape (N,) - does point 2 lie on the line drawn through points 1 and 3
+    """
+    if np is None:
+        raise ImportError("check_on_line_batch requires numpy")
+
+    points2 = np.asarray(points2, dtype=np.float64)
+    vectors21 = np.asarray(points1, dtype=np.float64) - points2
+    vectors23 = np.asarray(points3, dtype=np.float64) - points2
 
-    vector23 = (point3[0]-point2[0], point3[1]-point2[1], point3[2]-point2[2])
-    len_vector23 = (vector23[0]**2 + vector23[1]**2 + vector23[2]**2) ** 0.5
+    if not accuracy >= 0:  # also catches nan
+        return np.zeros(len(vectors21), dtype=bool)
 
-    cos_alfa = (vector21[0]*vector23[0] + vector21[1]*vector23[1] + vector21[2]*vector23[2]) / (len_vector21 * len_vector23)
-    eps = 0.00001 # the error of trigonometric functions
+    cross = np.cross(vectors21, vectors23)
+    cross2 = np.einsum('ij,ij->i', cross, cross)
+    dot = np.einsum('ij,ij->i', vectors21, vectors23)
+    len2_product = np.einsum('ij,ij->i', vectors21, vectors21) * np.einsum('ij,ij->i', vectors23, vectors23)
+    sin2_accuracy, obtuse_only = _sin2_threshold(accuracy)
 
-    return 180-accuracy <= math.degrees(math.acos(cos_alfa))+eps <= 180+accuracy
+    if obtuse_only:
+        return (dot <= 0.0) & (cross2 <= sin2_accuracy * len2_product)
+    return (dot <= 0.0) | (cross2 >= sin2_accuracy * len2_product)
@@ -0,0 +1,17 @@
+"""
+ahead-of-time build of the check_on_line kernel from _check_on_line_kernel.py.
+run `python _check_on_line_aot.py` once to get check_on_line_aot.*.so next to
+3_points.py: it is picked up on import, so short runs skip the jit warmup
+"""
+import os
+
+from numba.pycc import CC
+
+from _check_on_line_kernel import SIGNATURE, check_on_line_kernel
+
+cc = CC("check_on_line_aot")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+cc.export("check_on_line", SIGNATURE)(check_on_line_kernel)
+
+if __name__ == "__main__":
+    cc.compile()
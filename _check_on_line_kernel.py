@@ -0,0 +1,37 @@
+"""
+collinearity kernel shared by 3_points.py (numba jit) and
+_check_on_line_aot.py (numba aot). it is a regular module so that
+both, and numba's on-disk cache, can import it by name
+"""
+
+
+# nine coordinates, sin2_accuracy, obtuse_only. coordinates are always passed
+# as f8: the products in the kernel overflow int64 for large integer points
+SIGNATURE = "b1(f8, f8, f8, f8, f8, f8, f8, f8, f8, f8, b1)"
+
+
+def check_on_line_kernel(x1, y1, z1, x2, y2, z2, x3, y3, z3, sin2_accuracy, obtuse_only):
+    """
+    kernel of check_on_line working on plain floats, so numba can compile it
+    to native code. sin2_accuracy and obtuse_only come from _sin2_threshold
+    in 3_points.py.
+    only additions and multiplications are used: no sqrt, division or acos
+    """
+    dx1 = x1 - x2
+    dy1 = y1 - y2
+    dz1 = z1 - z2
+    dx3 = x3 - x2
+    dy3 = y3 - y2
+    dz3 = z3 - z2
+
+    # |v21 x v23|^2 = |v21|^2 * |v23|^2 * sin(alfa)^2
+    cx = dy1*dz3 - dz1*dy3
+    cy = dz1*dx3 - dx1*dz3
+    cz = dx1*dy3 - dy1*dx3
+    cross2 = cx*cx + cy*cy + cz*cz
+    dot = dx1*dx3 + dy1*dy3 + dz1*dz3
+    len2_product = (dx1*dx1 + dy1*dy1 + dz1*dz1) * (dx3*dx3 + dy3*dy3 + dz3*dz3)
+
+    if obtuse_only:
+        return dot <= 0.0 and cross2 <= sin2_accuracy * len2_product
+    return dot <= 0.0 or cross2 >= sin2_accuracy * len2_product
@@ -0,0 +1,133 @@
+"""
+tests for check_on_line from 3_points.py. every case is run through each
+available backend: the pure python kernel, the numba jit kernel, the aot
+kernel built by _check_on_line_aot.py and check_on_line_batch
+"""
+import importlib.util
+import math
+import os
+import random
+
+import pytest
+
+spec = importlib.util.spec_from_file_location(
+    "three_points", os.path.join(os.path.dirname(os.path.abspath(__file__)), "3_points.py")
+)
+three_points = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(three_points)
+
+
+def reference_check_on_line(point1, point2, point3, accuracy= 90.0):
+    """
+    the original acos based check, without its upper bound alfa+eps <= 180+accuracy
+    that rejected everything for accuracy=0
+    """
+    if not accuracy >= 0:
+        return False
+    vector21 = [a - b for a, b in zip(point1, point2)]
+    vector23 = [a - b for a, b in zip(point3, point2)]
+    cos_alfa = sum(a*b for a, b in zip(vector21, vector23)) / (math.hypot(*vector21) * math.hypot(*vector23))
+    cos_alfa = min(max(cos_alfa, -1.0), 1.0)
+    return 180-accuracy <= math.degrees(math.acos(cos_alfa))+0.00001
+
+
+@pytest.fixture(scope="session")
+def jit_kernel():
+    kernel = three_points._jit_kernel()
+    if not hasattr(kernel, "signatures"):
+        pytest.skip("numba is not installed")
+    return kernel
+
+
+def _batch(point1, point2, point3, accuracy= 90.0):
+    return bool(three_points.check_on_line_batch([point1], [point2], [point3], accuracy)[0])
+
+
+@pytest.fixture(params=["python", "numba", "aot", "batch"])
+def check_on_line(request, monkeypatch):
+    if request.param == "python":
+        monkeypatch.setattr(three_points, "_check_on_line_kernel", three_points._kernel.check_on_line_kernel)
+    elif request.param == "numba":
+        monkeypatch.setattr(three_points, "_check_on_line_kernel", request.getfixturevalue("jit_kernel"))
+    elif request.param == "aot":
+        if three_points._check_on_line_aot is None:
+            pytest.skip("check_on_line_aot is not built")
+        monkeypatch.setattr(three_points, "_check_on_line_kernel", three_points._check_on_line_aot)
+    else:
+        if three_points.np is None:
+            pytest.skip("numpy is not installed")
+        return _batch
+    return three_points.check_on_line
+
+
+@pytest.mark.parametrize("point1, point2, point3, accuracy, expected", [
+    ((0, 0, 0), (1, 1, 1), (2, 2, 2), 90.0, True),
+    ((0, 0, 0), (1, 0, 0), (1, 1, 0), 90.0, True),
+    ((0, 0, 0), (1, 0, 0), (0, 1, 0), 90.0, False),
+    ((0, 0, 0), (1, 0, 0), (2, 1, 0), 45.0, True),
+    ((0, 0, 0), (1, 0, 0), (1, 1, 0), 45.0, False),
+])
+def test_basic(check_on_line, point1, point2, point3, accuracy, expected):
+    assert check_on_line(point1, point2, point3, accuracy) is expected
+
+
+def test_accuracy_zero_accepts_only_straight_line(check_on_line):
+    assert check_on_line((0., 0., 0.), (1., 1., 1.), (2., 2., 2.), 0.0)
+    assert not check_on_line((0., 0., 0.), (1., 0., 0.), (2., 0.001, 0.), 0.0)
+
+
+@pytest.mark.parametrize("point2", [(0, 0, 0), (2, 1, 0)])
+def test_coincident_points_lie_on_line(check_on_line, point2):
+    assert check_on_line((0, 0, 0), point2, (2, 1, 0), 0.0)
+
+
+def test_accuracy_above_90_accepts_acute_angles(check_on_line):
+    # angle p1p2p3 is 60 degrees, it fits 180-135=45 but not 180-100=80
+    point3 = (math.cos(math.radians(60)), math.sin(math.radians(60)), 0.0)
+    assert check_on_line((1.0, 0.0, 0.0), (0.0, 0.0, 0.0), point3, 135.0)
+    assert not check_on_line((1.0, 0.0, 0.0), (0.0, 0.0, 0.0), point3, 100.0)
+
+
+@pytest.mark.parametrize("accuracy", [180.0, 250.0])
+@pytest.mark.parametrize("point3", [(1, 0.001, 0), (2, 0, 0)])
+def test_accuracy_above_180_accepts_everything(check_on_line, accuracy, point3):
+    # (2, 0, 0) makes an exact 0 degree angle, which random points never hit
+    assert check_on_line((1, 0, 0), (0, 0, 0), point3, accuracy)
+
+
+@pytest.mark.parametrize("accuracy", [-1.0, float("nan")])
+@pytest.mark.parametrize("point2", [(0, 0, 0), (1, 0, 0)])
+def test_negative_or_nan_accuracy_rejects_everything(check_on_line, point2, accuracy):
+    assert not check_on_line((0, 0, 0), point2, (2, 0, 0), accuracy)
+
+
+@pytest.mark.parametrize("point1, point2, point3, accuracy", [
+    ((0, 0, 0), (3_000_000, 0, 0), (6_000_000, 1, 0), 1.0),
+    ((0, 0, 0), (100_000, 100_000, 0), (200_000, 200_001, 0), 90.0),
+])
+def test_large_integer_points(check_on_line, point1, point2, point3, accuracy):
+    assert check_on_line(point1, point2, point3, accuracy)
+    assert check_on_line(point1, point2, point3, accuracy) == reference_check_on_line(point1, point2, point3, accuracy)
+
+
+@pytest.mark.parametrize("accuracy", [-1.0, 10.0])
+def test_batch_broadcasts_central_point(accuracy):
+    if three_points.np is None:
+        pytest.skip("numpy is not installed")
+    points1 = [(-i, 0, 0) for i in range(1, 6)]
+    points3 = [(i, i % 2, 0) for i in range(1, 6)]
+
+    result = three_points.check_on_line_batch(points1, [(0, 0, 0)], points3, accuracy)
+
+    assert result.shape == (5,)
+    expected = [three_points.check_on_line(p1, (0, 0, 0), p3, accuracy) for p1, p3 in zip(points1, points3)]
+    assert result.tolist() == expected
+
+
+def test_matches_reference_on_random_points(check_on_line):
+    rnd = random.Random(1)
+    for _ in range(2000):
+        point1, point2, point3 = (tuple(rnd.uniform(-5, 5) for _ in range(3)) for _ in range(3))
+        accuracy = rnd.choice([rnd.uniform(-10, 200), 0.0, 45.0, 90.0, 180.0])
+        expected = reference_check_on_line(point1, point2, point3, accuracy)
+        assert check_on_line(point1, point2, point3, accuracy) is expected